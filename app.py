@@ -6,9 +6,10 @@ app builds a :class:`engine.Recipe` from the user’s input, shows a dry-run
 preview, and finally sends the patch requests through
 :class:`engine.OmekaClient`.
 
-Transient UI state (authenticated client, cached look-ups, current operation
-table, …) lives in ``st.session_state`` so that Streamlit’s reruns do not wipe
-user input.
+Transient UI state (credentials, current operation table, …) lives in
+``st.session_state`` so that Streamlit’s reruns do not wipe user input;
+network look-ups (item sets, properties, values) are cached via
+``st.cache_data`` so reruns stay off the wire.
 
 Run from the project root:
 
@@ -16,6 +17,7 @@ Run from the project root:
 streamlit run app.py
 """
 
+import pandas as pd
 import streamlit as st
 
 from engine import OmekaClient
@@ -23,22 +25,59 @@ from recipes import Recipe, run_recipe
 
 st.set_page_config(page_title="Omeka S Batch Editor", layout="wide")
 
+
+# ── cached look-ups ──────────────────────────────────────────────────────────
+# Streamlit reruns the whole script on every widget interaction; without
+# caching, each rerun would redo the item-set / property / value HTTP calls.
+# The client itself is a cache_resource (one per credential triple), the
+# look-ups are cache_data with a 5-minute TTL.
+@st.cache_resource(show_spinner=False)
+def get_client(api_url: str, key_id: str, key_cred: str) -> OmekaClient:
+    """Build (and cache) one `OmekaClient` per credential triple."""
+    return OmekaClient(api_url, key_id, key_cred)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_item_sets(api_url: str, key_id: str, key_cred: str) -> list[dict]:
+    """Return all item sets of the site (cached for 5 min)."""
+    return get_client(api_url, key_id, key_cred).list_item_sets()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_resource_classes(api_url: str, key_id: str, key_cred: str) -> list[dict]:
+    """Return all resource classes of the site (cached for 5 min)."""
+    return get_client(api_url, key_id, key_cred)._get_all("resource_classes")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_property_terms(api_url: str, key_id: str, key_cred: str) -> list[str]:
+    """Return every property term of the site, sorted (cached for 5 min)."""
+    return sorted(p["o:term"] for p in get_client(api_url, key_id, key_cred)._get_all("properties"))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_property_values(api_url: str, key_id: str, key_cred: str, term: str) -> list[str]:
+    """Return distinct values for *term* (cached for 5 min)."""
+    return get_client(api_url, key_id, key_cred).list_property_values(term)
+
+
 # ── sidebar · credentials ────────────────────────────────────────────────────
 st.sidebar.title("Connect to Omeka S")
 api_url = st.sidebar.text_input("API URL", value="https://encyclo-technes.org/en/base/api")
 key_id = st.sidebar.text_input("Key identity")
 key_cred = st.sidebar.text_input("Key credential", type="password")
 if st.sidebar.button("Connect"):
-    st.session_state.client = OmekaClient(api_url, key_id, key_cred)
+    st.session_state.creds = (api_url, key_id, key_cred)
 
-client: OmekaClient = st.session_state.get("client")
-if not client:
+creds: tuple[str, str, str] = st.session_state.get("creds")
+if not creds:
     st.stop()
+client: OmekaClient = get_client(*creds)
 
 # ── step 1 · item sets & filters ─────────────────────────────────────────────
 st.header("Step 1 · Select targets")
 
-itemsets = {s["o:id"]: s.get("dcterms:title", [{}])[0].get("@value", "Untitled") for s in client.list_item_sets()}
+itemsets = {s["o:id"]: s.get("dcterms:title", [{}])[0].get("@value", "Untitled") for s in load_item_sets(*creds)}
 
 chosen_sets = st.multiselect(
     "Item sets:",
@@ -50,10 +89,7 @@ if not chosen_sets:
     st.stop()
 
 with st.expander("Filters (optional)"):
-    # pull resource classes once
-    if "classes" not in st.session_state:
-        st.session_state.classes = client._get_all("resource_classes")
-    class_map = {c["o:id"]: c["o:local_name"] for c in st.session_state.classes}
+    class_map = {c["o:id"]: c["o:local_name"] for c in load_resource_classes(*creds)}
 
     class_id = st.selectbox(
         "Keep only items of class …",
@@ -84,22 +120,6 @@ if OPS_KEY not in st.session_state:
 # Helper widgets – reactive, no st.form
 ###############################################################################
 
-# --- cache properties and value lists ---------------------------------------
-if "property_terms" not in st.session_state:
-    props_json = client._get_all("properties")
-    st.session_state.property_terms = sorted(p["o:term"] for p in props_json)
-
-st.session_state.setdefault("value_cache", {})
-
-
-def cached_values(term: str) -> list[str]:
-    """Return distinct values for *term*, cached per Streamlit session."""
-    cache = st.session_state.value_cache
-    if term not in cache:
-        cache[term] = client.list_property_values(term)  # new helper in engine
-    return cache[term]
-
-
 # --- interactive widgets -----------------------------------------------------
 c1, c2, c3, c4 = st.columns([1.2, 3, 3, 1.2])
 
@@ -107,7 +127,7 @@ c1, c2, c3, c4 = st.columns([1.2, 3, 3, 1.2])
 new_action = c1.selectbox("Action", ["add", "replace", "remove"], key="new_action")
 
 # 2 · Property + optional custom term
-term_options = st.session_state.property_terms + ["<custom term…>"]
+term_options = load_property_terms(*creds) + ["<custom term…>"]
 term_choice = c2.selectbox(
     "Property (type to search)",
     options=term_options,
@@ -119,7 +139,7 @@ if term_choice == "<custom term…>":
     value_options = []
 else:
     new_property = term_choice
-    value_options = cached_values(new_property)
+    value_options = load_property_values(*creds, new_property)
 
 # 3 · Value (choices depend on property); always reactive
 if value_options:
@@ -154,29 +174,26 @@ if st.button("➕ Add row"):
         st.success("Row added – see list below 👇", icon="✅")
 
 ###############################################################################
-# Read-only list / delete rows
+# Editable rule table
 ###############################################################################
 ops_list = st.session_state[OPS_KEY]
 
 if ops_list:
     st.markdown("### Current rule set")
-    md_table = "| # | Action | Property | Value | Lang |\n|---|---|---|---|---|\n"
-    for idx, row in enumerate(ops_list, 1):
-        md_table += f"| {idx} | {row['Action']} | {row['Property']} | {row['Value']} | {row['Language']} |\n"
-    st.markdown(md_table)
-
-    del_idx = st.number_input(
-        "Row # to delete (blank = nothing)",
-        min_value=1,
-        max_value=len(ops_list),
-        step=1,
-        format="%d",
+    # One editable grid replaces the hand-built markdown table plus the
+    # separate "row # to delete" round-trip: rows can be edited or removed
+    # in place and the result is written straight back to session state.
+    edited = st.data_editor(
+        pd.DataFrame(ops_list, columns=["Action", "Property", "Value", "Language"]),
+        num_rows="dynamic",
+        use_container_width=True,
+        key="ops_editor",
     )
-    if st.button("🗑️  Delete row"):
-        if 1 <= del_idx <= len(ops_list):
-            removed = st.session_state[OPS_KEY].pop(int(del_idx) - 1)
-            st.info(f"Deleted row {del_idx}: {removed}")
-            st.experimental_rerun()
+    # Rows added straight in the grid may still be half-filled: coerce the
+    # empty cells (NaN/None) to "" and drop rows without an Action or a
+    # Property, so downstream op parsing never sees an incomplete row.
+    edited = edited.fillna("")
+    st.session_state[OPS_KEY] = [row for row in edited.to_dict("records") if row["Action"].strip() and row["Property"].strip()]
 else:
     st.info("No rules yet – add some above.")
 
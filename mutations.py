@@ -13,14 +13,21 @@ Provided functions
 diff(a, b)
     Return the subset of key-value pairs whose value differs between two
     dictionaries—useful for a concise preview before pushing an update.
+compile_ops(ops)
+    Normalize GUI-style operation rows once into plain tuples so batch
+    callers do not repeat the per-op parsing for every resource.
 apply_ops(resource, ops)
     Execute GUI-style *add / replace / remove* rows against a resource
-    dict and return the mutated copy.
+    dict and return the mutated copy together with a *changed* flag.
 """
 
-import copy
 from typing import Any
 
+#: A normalized operation: ``(action, term, payload, language)``.  For adds
+#: and replaces the payload is the literal value; for removes it is a
+#: ``(drop_any, drop_exact)`` set pair (see :func:`compile_ops`).
+CompiledOp = tuple[str, str, Any, str | None]
+
 
 def diff(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
     """Return only the key–value pairs that changed from *a* to *b*.
@@ -37,7 +44,52 @@ def diff(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
     return {k: b[k] for k in b if a.get(k) != b[k]}
 
 
-def apply_ops(resource: dict[str, Any], ops: list[dict[str, str]]) -> dict[str, Any]:
+def compile_ops(ops: list[dict[str, str]]) -> list[CompiledOp]:
+    """Normalize GUI operation rows into ``(action, term, value, language)`` tuples.
+
+    Batch callers apply the same op table to every resource, so the
+    per-op string normalization (action case-folding, language/value
+    defaulting) is hoisted here and paid once instead of once per
+    resource.
+
+    Consecutive removes on the same term are fused into a single op whose
+    payload is a ``(drop_any, drop_exact)`` set pair — ``drop_any`` holds
+    values to drop regardless of language, ``drop_exact`` holds
+    ``(value, language)`` pairs.  :func:`apply_ops` can then drop K values
+    in one list traversal instead of rebuilding the list K times.
+
+    Args:
+        ops (list[dict[str, str]]): Operation rows as produced by the GUI
+            (see :func:`apply_ops` for the row format).
+
+    Returns:
+        list[CompiledOp]: Normalized tuples, in order; fused removes may
+        make the list shorter than the input.
+    """
+    compiled: list[CompiledOp] = []
+    for op in ops:
+        action = op["Action"].lower()
+        term = op["Property"]
+        value = op.get("Value") or ""
+        lang = op.get("Language") or None
+
+        if action != "remove":
+            compiled.append((action, term, value, lang))
+            continue
+
+        if compiled and compiled[-1][0] == "remove" and compiled[-1][1] == term:
+            drop_any, drop_exact = compiled[-1][2]
+        else:
+            drop_any, drop_exact = set(), set()
+            compiled.append(("remove", term, (drop_any, drop_exact), None))
+        if lang is None:
+            drop_any.add(value)
+        else:
+            drop_exact.add((value, lang))
+    return compiled
+
+
+def apply_ops(resource: dict[str, Any], ops: list[dict[str, str]] | list[CompiledOp]) -> tuple[dict[str, Any], bool]:
     """Apply *add / replace / remove* operations to an Omeka S resource.
 
     Each operation row is a four-field mapping produced by the GUI:
@@ -51,18 +103,25 @@ def apply_ops(resource: dict[str, Any], ops: list[dict[str, str]]) -> dict[str,
     * ``"Language"`` – ISO 639-1 language code associated with the value
       (``""`` or missing → no language).
 
-    The function works on a deep copy of *resource* so the original object
-    is left untouched.
+    The function never mutates *resource* and copies on write: the dict
+    is only duplicated once the first op actually changes something, and
+    value lists are always rebuilt rather than edited in place.  A batch
+    where most resources pass through unchanged therefore allocates
+    nothing for them, and untouched terms keep sharing their objects with
+    the input.
 
     Args:
         resource (dict[str, Any]): Omeka S resource JSON as returned by the
             REST API.
-        ops (list[dict[str, str]]): Sequence of operation rows, each with the
-            keys described above.
+        ops (list[dict[str, str]] | list[CompiledOp]): Sequence of operation
+            rows with the keys described above, or tuples pre-normalized
+            by :func:`compile_ops` (the cheaper form for batch callers).
 
     Returns:
-        dict[str, Any]: A new resource dictionary reflecting the requested
-        additions, replacements, or removals.
+        tuple[dict[str, Any], bool]: The resulting resource dictionary and
+        a *changed* flag.  The flag is tracked while the ops run, so
+        callers can skip unchanged resources without comparing two full
+        dicts; when nothing changed, *resource* itself is returned.
 
     Example:
         >>> apply_ops(
@@ -72,19 +131,34 @@ def apply_ops(resource: dict[str, Any], ops: list[dict[str, str]]) -> dict[str,
         ...       "Value": "New",
         ...       "Language": "en"}]
         ... )
-        {'dcterms:title': [{'@value': 'New', '@language': 'en'}]}
+        ({'dcterms:title': [{'@value': 'New', '@language': 'en'}]}, True)
     """
-    new_res = copy.deepcopy(resource)
-    for op in ops:
-        term = op["Property"]
-        action = op["Action"].lower()
-        lang = op.get("Language") or None
-        value = op.get("Value") or ""
-
+    if ops and isinstance(ops[0], dict):
+        ops = compile_ops(ops)
+
+    new_res = resource
+    changed = False
+
+    def _set(term: str, new_list: list[dict[str, Any]]) -> None:
+        # First real mutation copies the dict; lists are always rebuilt,
+        # never edited in place, so the input stays shareable.
+        nonlocal new_res, changed
+        if new_res is resource:
+            new_res = dict(resource)
+        new_res[term] = new_list
+        changed = True
+
+    for action, term, value, lang in ops:
+        current = new_res.get(term, ())
         if action == "add":
-            new_res.setdefault(term, []).append({"@value": value, "@language": lang})
+            _set(term, [*current, {"@value": value, "@language": lang}])
         elif action == "replace":
-            new_res[term] = [{"@value": value, "@language": lang}]
+            new_list = [{"@value": value, "@language": lang}]
+            if list(current) != new_list:
+                _set(term, new_list)
         elif action == "remove":
-            new_res[term] = [v for v in new_res.get(term, []) if v.get("@value") != value or (lang and v.get("@language") != lang)]
-    return new_res
+            drop_any, drop_exact = value
+            kept = [v for v in current if v.get("@value") not in drop_any and (v.get("@value"), v.get("@language")) not in drop_exact]
+            if len(kept) != len(current):
+                _set(term, kept)
+    return new_res, changed
@@ -1,4 +1,9 @@
+import gzip
+import io
+import json
+
 import requests
+import urllib3
 
 from engine import OmekaClient
 
@@ -10,7 +15,7 @@ def _client(monkeypatch):
     # Monkey-patch the private _get_all to avoid real HTTP
     def fake_get_all(endpoint, **params):
         if endpoint == "properties":
-            return [{"o:id": 111}]  # prop_id looked up once
+            return [{"o:id": 111, "o:term": "dcterms:title"}]  # prop_id looked up once
         if endpoint == "values":
             return [{"@value": "A"}, {"o:label": "B"}, {"@value": "A"}]
         raise AssertionError("Unexpected endpoint")
@@ -30,26 +35,158 @@ def test_list_property_values_fallback(monkeypatch):
     """Simulate the /values endpoint raising HTTPError → fallback scan."""
     client = OmekaClient("https://demo/api", "id", "cred")
 
-    calls = {"page": 0}
-
     def fake_get_all(endpoint, **params):
         if endpoint == "properties":
-            return [{"o:id": 222}]
+            return [{"o:id": 222, "o:term": "dcterms:title"}]
         if endpoint == "values":
             raise requests.HTTPError("simulate 404")  # force fallback
-        if endpoint == "items":
-            page = params.get("page")
-            calls["page"] = page
-            # first page returns one item with two values, second page empty
-            if page == 1:
-                return [
-                    {"dcterms:title": [{"@value": "X"}]},
-                    {"dcterms:title": [{"o:label": "Y"}]},
-                ]
-            return []  # stop pagination
         raise AssertionError("Unexpected endpoint")
 
+    def fake_iter_all(endpoint, **params):
+        assert endpoint == "items"
+        yield {"dcterms:title": [{"@value": "X"}]}
+        yield {"dcterms:title": [{"o:label": "Y"}]}
+
     monkeypatch.setattr(client, "_get_all", fake_get_all)
+    monkeypatch.setattr(client, "_iter_all", fake_iter_all)
 
     assert client.list_property_values("dcterms:title", limit=10) == ["X", "Y"]
-    assert calls["page"] == 2  # proved that pagination happened
+
+
+def test_list_property_values_fallback_stops_at_limit(monkeypatch):
+    """The fallback scan must abandon the item stream once *limit* is hit."""
+    client = OmekaClient("https://demo/api", "id", "cred")
+
+    def fake_get_all(endpoint, **params):
+        if endpoint == "properties":
+            return [{"o:id": 222, "o:term": "dcterms:title"}]
+        raise requests.HTTPError("simulate 404")
+
+    def endless_items(endpoint, **params):
+        n = 0
+        while True:  # would never terminate without the limit break
+            yield {"dcterms:title": [{"@value": f"v{n:04d}"}]}
+            n += 1
+
+    monkeypatch.setattr(client, "_get_all", fake_get_all)
+    monkeypatch.setattr(client, "_iter_all", endless_items)
+
+    assert client.list_property_values("dcterms:title", limit=3) == ["v0000", "v0001", "v0002"]
+
+
+class FakeResponse:
+    def __init__(self, payload, headers=None):
+        self.content = json.dumps(payload).encode()
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serve canned pages keyed by the ``page`` query parameter."""
+
+    def __init__(self, pages, headers=None):
+        self.pages = pages
+        self.headers_by_page = headers or {}
+
+    def get(self, url, params=None):
+        page = params["page"]
+        return FakeResponse(self.pages.get(page, []), self.headers_by_page.get(page))
+
+
+def test_get_all_concatenates_pages_in_order():
+    client = OmekaClient("https://demo/api", "id", "cred")
+    client.s = FakeSession({1: [{"o:id": 1}], 2: [{"o:id": 2}], 3: [{"o:id": 3}]})
+
+    assert [r["o:id"] for r in client._get_all("items")] == [1, 2, 3]
+
+
+def test_get_all_uses_total_results_header():
+    client = OmekaClient("https://demo/api", "id", "cred")
+    client.s = FakeSession(
+        {1: [{"o:id": 1}, {"o:id": 2}], 2: [{"o:id": 3}, {"o:id": 4}]},
+        headers={1: {"Omeka-S-Total-Results": "4"}},
+    )
+
+    assert [r["o:id"] for r in client._get_all("items")] == [1, 2, 3, 4]
+
+
+def test_property_table_fetched_once(monkeypatch):
+    client = OmekaClient("https://demo/api", "id", "cred")
+    calls = {"properties": 0}
+
+    def fake_get_all(endpoint, **params):
+        calls[endpoint] += 1
+        return [{"o:id": 1, "o:term": "dcterms:title"}, {"o:id": 2, "o:term": "dcterms:creator"}]
+
+    monkeypatch.setattr(client, "_get_all", fake_get_all)
+
+    assert client._property_id("dcterms:title") == 1
+    assert client._property_id("dcterms:creator") == 2
+    assert calls["properties"] == 1  # memoized after first lookup
+
+
+def test_list_media_for_items_chunks_array_filters(monkeypatch):
+    client = OmekaClient("https://demo/api", "id", "cred")
+    seen_params = []
+
+    def fake_get_all(endpoint, **params):
+        assert endpoint == "media"
+        seen_params.append(params)
+        return [{"o:id": 100 + params["item_id[0]"]}]
+
+    monkeypatch.setattr(client, "_get_all", fake_get_all)
+
+    media = client.list_media_for_items([1, 2, 3], chunk_size=2)
+
+    # chunks may be fetched in parallel, but results keep chunk order
+    assert [m["o:id"] for m in media] == [101, 103]
+    assert sorted(seen_params, key=len, reverse=True) == [
+        {"item_id[0]": 1, "item_id[1]": 2},
+        {"item_id[0]": 3},
+    ]
+
+
+class StreamingFakeSession:
+    """Serve gzip-compressed pages through a real urllib3 raw stream."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, params=None, stream=False):
+        payload = self.pages.get(params["page"], [])
+        response = FakeResponse(payload)
+        # Mirror what requests exposes on a streamed response: r.raw is the
+        # undecoded transport stream, compressed when the server compresses.
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(gzip.compress(response.content)),
+            headers={"Content-Encoding": "gzip"},
+            status=200,
+            preload_content=False,
+            decode_content=False,  # requests defers decoding, like here
+        )
+        return response
+
+
+def test_iter_all_stream_decodes_compressed_pages():
+    """The ijson path must gunzip r.raw before incremental parsing."""
+    client = OmekaClient("https://demo/api", "id", "cred")
+    client.s = StreamingFakeSession({1: [{"o:id": 1}, {"o:id": 2}], 2: []})
+
+    assert [r["o:id"] for r in client._iter_all_stream("items")] == [1, 2]
+
+
+def test_key_auth_signs_urls():
+    from engine import _KeyAuth
+
+    auth = _KeyAuth("my-id", "my-cred")
+
+    class Prepared:
+        url = "https://demo/api/items"
+
+    signed = auth(Prepared())
+    assert signed.url == "https://demo/api/items?key_identity=my-id&key_credential=my-cred"
+
+    Prepared.url = "https://demo/api/items?page=2"
+    assert auth(Prepared()).url.endswith("page=2&key_identity=my-id&key_credential=my-cred")
@@ -58,5 +58,81 @@ def test_diff_only_changed_keys():
 def test_apply_ops(ops, expected):
     """Check each action type in isolation."""
     before = {"dcterms:title": [{"@value": "Foo", "@language": None}]}
-    after = apply_ops(before, ops)
+    after, changed = apply_ops(before, ops)
+    assert changed
     assert after["dcterms:title"] == expected
+
+
+def test_apply_ops_leaves_original_untouched():
+    before = {
+        "dcterms:title": [{"@value": "Foo", "@language": None}],
+        "dcterms:creator": [{"@value": "Someone", "@language": None}],
+    }
+    after, _ = apply_ops(
+        before,
+        [{"Action": "replace", "Property": "dcterms:title", "Value": "Bar", "Language": ""}],
+    )
+
+    assert before["dcterms:title"] == [{"@value": "Foo", "@language": None}]
+    assert after["dcterms:title"] == [{"@value": "Bar", "@language": None}]
+    # untouched terms share their objects with the input (shallow copy)
+    assert after["dcterms:creator"] is before["dcterms:creator"]
+
+
+def test_apply_ops_short_circuits_impossible_removes():
+    before = {"dcterms:title": [{"@value": "Foo", "@language": None}]}
+    ops = [{"Action": "remove", "Property": "dcterms:creator", "Value": "X", "Language": ""}]
+
+    after, changed = apply_ops(before, ops)
+    assert after is before  # same object, no copy made
+    assert not changed
+
+
+def test_compile_ops_normalizes_rows():
+    from mutations import compile_ops
+
+    rows = [
+        {"Action": "Add", "Property": "dcterms:title", "Value": "Hi", "Language": "en"},
+        {"Action": "REMOVE", "Property": "dcterms:creator", "Value": "", "Language": ""},
+    ]
+
+    compiled = compile_ops(rows)
+
+    assert compiled == [
+        ("add", "dcterms:title", "Hi", "en"),
+        ("remove", "dcterms:creator", ({""}, set()), None),
+    ]
+    # apply_ops accepts the compiled form directly
+    after, _ = apply_ops({"dcterms:title": []}, compiled)
+    assert after["dcterms:title"] == [{"@value": "Hi", "@language": "en"}]
+
+
+def test_compile_ops_fuses_consecutive_removes():
+    from mutations import compile_ops
+
+    rows = [
+        {"Action": "remove", "Property": "dcterms:subject", "Value": "A", "Language": ""},
+        {"Action": "remove", "Property": "dcterms:subject", "Value": "B", "Language": "fr"},
+    ]
+
+    compiled = compile_ops(rows)
+    assert compiled == [("remove", "dcterms:subject", ({"A"}, {("B", "fr")}), None)]
+
+    before = {
+        "dcterms:subject": [
+            {"@value": "A", "@language": "en"},  # dropped: language-agnostic match
+            {"@value": "B", "@language": "fr"},  # dropped: exact (value, lang) match
+            {"@value": "B", "@language": "en"},  # kept: language differs
+        ],
+    }
+    after, _ = apply_ops(before, compiled)
+    assert after["dcterms:subject"] == [{"@value": "B", "@language": "en"}]
+
+
+def test_apply_ops_reports_unchanged_for_identical_replace():
+    before = {"dcterms:title": [{"@value": "Same", "@language": "en"}]}
+    ops = [{"Action": "replace", "Property": "dcterms:title", "Value": "Same", "Language": "en"}]
+
+    after, changed = apply_ops(before, ops)
+    assert not changed
+    assert after is before
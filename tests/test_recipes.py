@@ -30,6 +30,9 @@ class DummyClient(OmekaClient):  # inherits just for type compatibility
         }
         return items.get(set_id, [])
 
+    def iter_items(self, **params):
+        yield from self.list_items(**params)
+
     def _get_all(self, endpoint, **params):
         """Return two media for item 1."""
         if endpoint == "media":
@@ -66,3 +69,123 @@ def test_select_with_media_deduplicates():
     # item 1 + one unique medium
     assert sorted(ids) == [1, 99]
     assert ids.count(99) == 1  # deduplicated
+
+
+class _OkResponse:
+    def raise_for_status(self):
+        pass
+
+
+class RecordingSession:
+    """Stand-in for requests.Session that records PATCH calls."""
+
+    def __init__(self):
+        self.patched = []
+
+    def patch(self, url, json=None, params=None, data=None):
+        self.patched.append((url, params))
+        return _OkResponse()
+
+
+def test_run_recipe_write_mode_patches_concurrently():
+    from recipes import run_recipe
+
+    client = DummyClient()
+    client.base = "https://demo/api"
+    client.s = RecordingSession()
+
+    r = Recipe(
+        item_set_ids=[1],
+        resource_types=["items"],
+        ops=[{"Action": "add", "Property": "dcterms:creator", "Value": "Doe", "Language": ""}],
+    )
+    report = run_recipe(client, r, dry_run=False, max_workers=4)
+
+    assert report["errors"] == []
+    assert [u["id"] for u in report["updated"]] == [1]
+    assert client.s.patched == [("https://demo/api/items/1", None)]
+
+
+def test_run_recipe_batches_identical_diffs():
+    from recipes import run_recipe
+
+    client = DummyClient()
+    client.base = "https://demo/api"
+    client.s = RecordingSession()
+
+    r = Recipe(
+        item_set_ids=[1, 2],  # two items, same add op → identical diff
+        resource_types=["items"],
+        ops=[{"Action": "add", "Property": "dcterms:creator", "Value": "Doe", "Language": ""}],
+    )
+    report = run_recipe(client, r, dry_run=False)
+
+    assert report["errors"] == []
+    assert sorted(u["id"] for u in report["updated"]) == [1, 2]
+    # one batch_update call covering both ids instead of two PATCHes
+    assert client.s.patched == [("https://demo/api/items", {"id[0]": 1, "id[1]": 2})]
+
+
+def test_select_items_deduplicates_overlapping_sets():
+    client = DummyClient()
+    r = Recipe(
+        item_set_ids=[1, 1],  # same set twice → same item twice
+        resource_types=["items"],
+        ops=[],
+    )
+    items = r.select_items(client)
+    assert [it["o:id"] for it in items] == [1]
+
+
+def test_select_caches_between_calls():
+    client = DummyClient()
+    calls = {"n": 0}
+    original = client.list_items
+
+    def counting_list_items(**params):
+        calls["n"] += 1
+        return original(**params)
+
+    client.list_items = counting_list_items
+    r = Recipe(item_set_ids=[1, 2], resource_types=["items"], ops=[])
+
+    first = r.select(client)
+    second = r.select(client)  # e.g. the write pass after a dry run
+    assert second is first
+    assert calls["n"] == 2  # one per item set, fetched only once
+
+    r.invalidate_cache()
+    r.select(client)
+    assert calls["n"] == 4  # refetched after invalidation
+
+
+class BatchRejectingSession(RecordingSession):
+    """Refuse the batch form (params-based) but accept per-item PATCHes."""
+
+    def patch(self, url, json=None, params=None, data=None):
+        if params is not None:
+            raise RuntimeError("batch_update unsupported")
+        return super().patch(url, json=json, params=params, data=data)
+
+
+def test_run_recipe_falls_back_to_per_item_patches():
+    from recipes import run_recipe
+
+    client = DummyClient()
+    client.base = "https://demo/api"
+    client.s = BatchRejectingSession()
+
+    r = Recipe(
+        item_set_ids=[1, 2],
+        resource_types=["items"],
+        ops=[{"Action": "add", "Property": "dcterms:creator", "Value": "Doe", "Language": ""}],
+    )
+    report = run_recipe(client, r, dry_run=False)
+
+    assert report["errors"] == []
+    assert sorted(u["id"] for u in report["updated"]) == [1, 2]
+    assert sorted(url for url, _ in client.s.patched) == [
+        "https://demo/api/items/1",
+        "https://demo/api/items/2",
+    ]
+    assert client._batch_update_supported is False  # probed and remembered